@@ -52,22 +52,22 @@ class PortfolioRiskManager:
         Returns:
             Portfolio heat as decimal (0.15 = 15% at risk)
         """
-        total_risk = 0.0
-
-        for position in positions:
-            # Skip positions without stop-loss
-            if not position.get('stop_loss'):
-                continue
-
-            current_price = position.get('current_price', position.get('entry_price'))
-            stop_loss = position['stop_loss']
-            shares = position['shares']
-
-            # Calculate risk per position (amount lost if stop hits)
-            risk_per_share = abs(current_price - stop_loss)
-            position_risk = risk_per_share * shares
-
-            total_risk += position_risk
+        # Positions without a stop-loss carry no defined risk
+        stopped = np.array(
+            [
+                (
+                    position.get('current_price', position.get('entry_price')),
+                    position['stop_loss'],
+                    position['shares'],
+                )
+                for position in positions
+                if position.get('stop_loss')
+            ],
+            dtype=float,
+        )
+
+        # Risk per position = distance to stop-loss × shares
+        total_risk = float(np.abs(stopped[:, 0] - stopped[:, 1]).dot(stopped[:, 2])) if len(stopped) else 0.0
 
         # Calculate heat as percentage of portfolio
         portfolio_heat = total_risk / portfolio_value if portfolio_value > 0 else 0.0
@@ -130,7 +130,7 @@ class PortfolioRiskManager:
             start_date = end_date - timedelta(days=lookback_days)
 
             # Download data
-            logger.info(f"Calculating correlation matrix for {len(symbols)} symbols")
+            logger.info("Calculating correlation matrix for %d symbols", len(symbols))
             data = yf.download(
                 symbols,
                 start=start_date.strftime('%Y-%m-%d'),
@@ -158,7 +158,7 @@ class PortfolioRiskManager:
             return corr_matrix
 
         except Exception as e:
-            logger.error(f"Failed to calculate correlation matrix: {e}")
+            logger.error("Failed to calculate correlation matrix: %s", e)
             # Return identity matrix as fallback (no correlation)
             return pd.DataFrame(np.eye(len(symbols)), index=symbols, columns=symbols)
 
@@ -208,7 +208,7 @@ class PortfolioRiskManager:
 
             clusters.append(cluster)
 
-        logger.info(f"Found {len(clusters)} correlation clusters: {clusters}")
+        logger.info("Found %d correlation clusters: %s", len(clusters), clusters)
         return clusters
 
     def check_correlated_exposure(
@@ -1,6 +1,7 @@
 """Position tracking and management for active trades"""
 
 import logging
+import sys
 from typing import Dict, Optional, List
 from dataclasses import dataclass
 from datetime import datetime
@@ -8,7 +9,7 @@ from datetime import datetime
 logger = logging.getLogger(__name__)
 
 
-@dataclass
+@dataclass(slots=True)
 class Position:
     """Represents an open position"""
     symbol: str
@@ -55,6 +56,8 @@ class PositionManager:
         take_profit: Optional[float] = None
     ) -> Position:
         """Add a new position"""
+        # Tickers are a small, recurring set; share one key object per symbol
+        symbol = sys.intern(str(symbol))
         position = Position(
             symbol=symbol,
             strategy_id=strategy_id,
@@ -69,18 +72,18 @@ class PositionManager:
             self.positions[strategy_id] = {}
 
         self.positions[strategy_id][symbol] = position
-        logger.info(f"Added position: {strategy_id} - {shares} {symbol} @ ${entry_price:.2f}")
+        logger.info("Added position: %s - %s %s @ $%.2f", strategy_id, shares, symbol, entry_price)
 
         return position
 
     def remove_position(self, strategy_id: str, symbol: str) -> Optional[Position]:
         """Remove and return a position"""
         if not self.has_position(strategy_id, symbol):
-            logger.warning(f"Cannot remove position - not found: {strategy_id}/{symbol}")
+            logger.warning("Cannot remove position - not found: %s/%s", strategy_id, symbol)
             return None
 
         position = self.positions[strategy_id].pop(symbol)
-        logger.info(f"Removed position: {strategy_id} - {position.shares} {symbol}")
+        logger.info("Removed position: %s - %s %s", strategy_id, position.shares, symbol)
 
         # Clean up empty strategy dict
         if not self.positions[strategy_id]:
@@ -135,7 +138,7 @@ class PositionManager:
 
         count = len(self.positions[strategy_id])
         del self.positions[strategy_id]
-        logger.info(f"Cleared {count} positions for strategy {strategy_id}")
+        logger.info("Cleared %d positions for strategy %s", count, strategy_id)
         return count
 
     def get_total_exposure(self, current_prices: Dict[str, float]) -> float:
@@ -197,17 +197,22 @@ class StrategyLogic:
         # For simplicity, we'll use different MA periods to simulate timeframes
         # In production, you'd fetch actual hourly/5min data
 
+        # Only the latest value of each MA is needed, so average the trailing
+        # window directly rather than rolling over the whole history
+        close = data['close'].to_numpy(dtype=float)
+        current_price = close[-1]
+
         # Daily trend (slow MA)
-        daily_ma = data['close'].rolling(window=50).mean()
-        daily_signal = 1 if data['close'].iloc[-1] > daily_ma.iloc[-1] else -1
+        daily_ma = close[-50:].mean()
+        daily_signal = 1 if current_price > daily_ma else -1
 
         # Hourly trend (medium MA)
-        hourly_ma = data['close'].rolling(window=20).mean()
-        hourly_signal = 1 if data['close'].iloc[-1] > hourly_ma.iloc[-1] else -1
+        hourly_ma = close[-20:].mean()
+        hourly_signal = 1 if current_price > hourly_ma else -1
 
         # Intraday trend (fast MA)
-        intraday_ma = data['close'].rolling(window=5).mean()
-        intraday_signal = 1 if data['close'].iloc[-1] > intraday_ma.iloc[-1] else -1
+        intraday_ma = close[-5:].mean()
+        intraday_signal = 1 if current_price > intraday_ma else -1
 
         # Calculate alignment
         signals = [daily_signal, hourly_signal, intraday_signal]
@@ -14,6 +14,8 @@ from core.config import (
     SKLEARN_AVAILABLE,
     SCIPY_AVAILABLE,
     TALIB_AVAILABLE,
+    NUMBA_AVAILABLE,
+    BOTTLENECK_AVAILABLE,
     ALPACA_AVAILABLE,
     PYTORCH_AVAILABLE,
     TRANSFORMERS_AVAILABLE,
@@ -72,6 +74,8 @@ __all__ = [
     'SKLEARN_AVAILABLE',
     'SCIPY_AVAILABLE',
     'TALIB_AVAILABLE',
+    'NUMBA_AVAILABLE',
+    'BOTTLENECK_AVAILABLE',
     'ALPACA_AVAILABLE',
     'PYTORCH_AVAILABLE',
     'TRANSFORMERS_AVAILABLE',
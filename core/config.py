@@ -2,7 +2,8 @@
 
 import warnings
 import logging
-from datetime import datetime, time
+import time as _time
+from datetime import datetime, time, timedelta
 from enum import Enum
 import pytz
 import os
@@ -60,6 +61,18 @@ try:
 except ImportError:
     TALIB_AVAILABLE = False
 
+try:
+    import numba
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+try:
+    import bottleneck
+    BOTTLENECK_AVAILABLE = True
+except ImportError:
+    BOTTLENECK_AVAILABLE = False
+
 try:
     from alpaca_trade_api import REST, Stream
     from alpaca_trade_api.common import URL
@@ -140,20 +153,49 @@ def setup_logging():
 # MARKET HOURS UTILITIES
 # ============================================================================
 
-def is_market_open():
-    """Check if US stock market is currently open"""
-    try:
-        eastern = pytz.timezone('US/Eastern')
-        now = datetime.now(eastern)
+_EASTERN = pytz.timezone('US/Eastern')
+_MARKET_OPEN = time(9, 30)
+_MARKET_CLOSE = time(16, 0)
+
+
+def _now_eastern():
+    """Take a single snapshot of the current US/Eastern wall-clock time."""
+    return datetime.fromtimestamp(_time.time(), _EASTERN)
 
-        if now.weekday() >= 5:
-            return False
 
-        market_open = time(9, 30)
-        market_close = time(16, 0)
-        current_time = now.time()
+def _is_market_open(now):
+    """Check whether the market is open at the given Eastern time."""
+    if now.weekday() >= 5:
+        return False
 
-        return market_open <= current_time <= market_close
+    return _MARKET_OPEN <= now.time() <= _MARKET_CLOSE
+
+
+def _time_until_open(now):
+    """Seconds from the given Eastern time until the next market open."""
+    if _is_market_open(now):
+        return 0
+
+    days_ahead = 0
+    if now.weekday() == 5:
+        days_ahead = 2
+    elif now.weekday() == 6:
+        days_ahead = 1
+    elif now.time() >= _MARKET_CLOSE:
+        days_ahead = 1
+
+    next_open = now.replace(hour=9, minute=30, second=0, microsecond=0)
+    if days_ahead > 0:
+        next_open += timedelta(days=days_ahead)
+
+    seconds_until_open = (next_open - now).total_seconds()
+    return max(0, seconds_until_open)
+
+
+def is_market_open():
+    """Check if US stock market is currently open"""
+    try:
+        return _is_market_open(_now_eastern())
     except Exception:
         return True
 
@@ -161,46 +203,26 @@ def is_market_open():
 def get_time_until_market_open():
     """Get seconds until market opens. Returns 0 if market is open."""
     try:
-        eastern = pytz.timezone('US/Eastern')
-        now = datetime.now(eastern)
-
-        if is_market_open():
-            return 0
-
-        days_ahead = 0
-        if now.weekday() == 5:
-            days_ahead = 2
-        elif now.weekday() == 6:
-            days_ahead = 1
-        elif now.time() >= time(16, 0):
-            days_ahead = 1
-
-        next_open = now.replace(hour=9, minute=30, second=0, microsecond=0)
-        if days_ahead > 0:
-            from datetime import timedelta
-            next_open += timedelta(days=days_ahead)
-
-        seconds_until_open = (next_open - now).total_seconds()
-        return max(0, seconds_until_open)
+        return _time_until_open(_now_eastern())
     except Exception:
         return 0
 
 
 def get_market_status_message():
     """Get a formatted message about market status"""
-    if is_market_open():
+    # Read the clock once so the open/closed check and the countdown agree
+    now = _now_eastern()
+
+    if _is_market_open(now):
         return "🟢 Market is OPEN"
     else:
-        seconds = get_time_until_market_open()
+        seconds = _time_until_open(now)
         hours = int(seconds // 3600)
         minutes = int((seconds % 3600) // 60)
 
-        eastern = pytz.timezone('US/Eastern')
-        now = datetime.now(eastern)
-
         if now.weekday() >= 5:
             return f"🔴 Market CLOSED (Weekend) - Opens in {hours}h {minutes}m"
-        elif now.time() < time(9, 30):
+        elif now.time() < _MARKET_OPEN:
             return f"🟡 Pre-market - Opens in {hours}h {minutes}m"
         else:
             return f"🔴 After-hours - Opens in {hours}h {minutes}m"
@@ -321,6 +343,8 @@ def get_dependency_status():
         'yfinance': YF_AVAILABLE,
         'scikit-learn': SKLEARN_AVAILABLE,
         'TA-Lib': TALIB_AVAILABLE,
+        'Numba': NUMBA_AVAILABLE,
+        'Bottleneck': BOTTLENECK_AVAILABLE,
         'SciPy': SCIPY_AVAILABLE,
         'Alpaca API': ALPACA_AVAILABLE,
         'PyTorch': PYTORCH_AVAILABLE,
@@ -346,6 +370,10 @@ def install_dependencies():
         packages_to_install.append('scikit-learn')
     if not SCIPY_AVAILABLE:
         packages_to_install.append('scipy')
+    if not NUMBA_AVAILABLE:
+        packages_to_install.append('numba')
+    if not BOTTLENECK_AVAILABLE:
+        packages_to_install.append('bottleneck')
     if not ALPACA_AVAILABLE:
         packages_to_install.append('alpaca-trade-api')
     if not PYTORCH_AVAILABLE:
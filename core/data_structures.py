@@ -67,7 +67,7 @@ class TradeSignal:
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class TradeRecord:
     """Record of an executed trade."""
     symbol: str
@@ -101,7 +101,7 @@ class TradeRecord:
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class Position:
     """Represents an open position."""
     symbol: str
@@ -149,7 +149,7 @@ class Position:
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class OptionsLeg:
     """Single leg of an options strategy."""
     option_type: OptionType
@@ -178,7 +178,7 @@ class OptionsSignal:
     reasoning: str = ""
 
 
-@dataclass
+@dataclass(slots=True)
 class PortfolioSnapshot:
     """Snapshot of portfolio state."""
     timestamp: datetime
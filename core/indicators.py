@@ -3,11 +3,144 @@
 import pandas as pd
 import numpy as np
 from typing import Optional
-from .config import TALIB_AVAILABLE, TradingConfig
+from .config import (
+    TALIB_AVAILABLE, NUMBA_AVAILABLE, BOTTLENECK_AVAILABLE, TradingConfig
+)
 
 if TALIB_AVAILABLE:
     import talib
 
+if BOTTLENECK_AVAILABLE:
+    import bottleneck as bn
+
+if NUMBA_AVAILABLE:
+    from numba import njit
+
+    @njit(cache=True)
+    def _rolling_mad(values, window):
+        """Rolling mean absolute deviation over a trailing window."""
+        out = np.full(values.shape[0], np.nan)
+        for i in range(window - 1, values.shape[0]):
+            total = 0.0
+            for j in range(i - window + 1, i + 1):
+                total += values[j]
+            mean = total / window
+
+            deviation = 0.0
+            for j in range(i - window + 1, i + 1):
+                deviation += abs(values[j] - mean)
+            out[i] = deviation / window
+
+        return out
+
+    @njit(cache=True, error_model='numpy')
+    def _trailing_window_indicators(high, low, close, window):
+        """RSI, ATR, stochastic %K and Williams %R in one pass over the bars.
+
+        Every output bar reads its own trailing window once for all four
+        indicators. NaN handling follows the pandas versions: NaN price
+        moves count as zero for RSI, true range skips NaN terms, and a NaN
+        high/low anywhere in the window yields NaN.
+        """
+        n = close.shape[0]
+        rsi = np.full(n, np.nan)
+        atr = np.full(n, np.nan)
+        stoch_k = np.full(n, np.nan)
+        williams_r = np.full(n, np.nan)
+
+        for i in range(window - 1, n):
+            gain = 0.0
+            loss = 0.0
+            tr_total = 0.0
+            highest = -np.inf
+            lowest = np.inf
+            for j in range(i - window + 1, i + 1):
+                tr = high[j] - low[j]
+                if j > 0:
+                    delta = close[j] - close[j - 1]
+                    if delta > 0:
+                        gain += delta
+                    elif delta < 0:
+                        loss -= delta
+
+                    for gap in (abs(high[j] - close[j - 1]), abs(low[j] - close[j - 1])):
+                        if np.isnan(tr) or gap > tr:
+                            tr = gap
+                tr_total += tr
+
+                if np.isnan(high[j]) or highest != highest:
+                    highest = np.nan
+                elif high[j] > highest:
+                    highest = high[j]
+                if np.isnan(low[j]) or lowest != lowest:
+                    lowest = np.nan
+                elif low[j] < lowest:
+                    lowest = low[j]
+
+            rsi[i] = 100 - (100 / (1 + gain / loss))
+            atr[i] = tr_total / window
+            stoch_k[i] = 100 * ((close[i] - lowest) / (highest - lowest))
+            williams_r[i] = -100 * (highest - close[i]) / (highest - lowest)
+
+        return rsi, atr, stoch_k, williams_r
+
+
+# Rolling-window helpers. Each works down axis 0 and returns NaN until the
+# window is full (same as pandas' default min_periods, including all-NaN when
+# the window is longer than the input), using bottleneck's
+# specialised C loops when available and pandas otherwise.
+
+def _flat_windows(values: np.ndarray, window: int) -> np.ndarray:
+    """Mask of windows holding a single repeated value.
+
+    bottleneck's running sums leave rounding residue on such windows where
+    pandas returns the exact mean and a zero deviation; callers snap them.
+    """
+    if window > values.shape[0]:
+        return np.zeros(values.shape, dtype=bool)
+    return (
+        bn.move_max(values, window, min_count=window, axis=0)
+        == bn.move_min(values, window, min_count=window, axis=0)
+    )
+
+
+def _rolling_mean(values: np.ndarray, window: int) -> np.ndarray:
+    """Trailing rolling mean."""
+    if window > values.shape[0]:
+        return np.full(values.shape, np.nan)
+    if BOTTLENECK_AVAILABLE:
+        mean = bn.move_mean(values, window, min_count=window, axis=0)
+        return np.where(_flat_windows(values, window), values, mean)
+    return pd.DataFrame(values).rolling(window=window).mean().to_numpy().reshape(values.shape)
+
+
+def _rolling_std(values: np.ndarray, window: int) -> np.ndarray:
+    """Trailing rolling sample standard deviation (ddof=1, as in pandas)."""
+    if window > values.shape[0]:
+        return np.full(values.shape, np.nan)
+    if BOTTLENECK_AVAILABLE:
+        std = bn.move_std(values, window, min_count=window, axis=0, ddof=1)
+        return np.where(_flat_windows(values, window), 0.0, std)
+    return pd.DataFrame(values).rolling(window=window).std().to_numpy().reshape(values.shape)
+
+
+def _rolling_min(values: np.ndarray, window: int) -> np.ndarray:
+    """Trailing rolling minimum."""
+    if window > values.shape[0]:
+        return np.full(values.shape, np.nan)
+    if BOTTLENECK_AVAILABLE:
+        return bn.move_min(values, window, min_count=window, axis=0)
+    return pd.DataFrame(values).rolling(window=window).min().to_numpy().reshape(values.shape)
+
+
+def _rolling_max(values: np.ndarray, window: int) -> np.ndarray:
+    """Trailing rolling maximum."""
+    if window > values.shape[0]:
+        return np.full(values.shape, np.nan)
+    if BOTTLENECK_AVAILABLE:
+        return bn.move_max(values, window, min_count=window, axis=0)
+    return pd.DataFrame(values).rolling(window=window).max().to_numpy().reshape(values.shape)
+
 
 class AdvancedIndicators:
     """Calculate advanced technical indicators."""
@@ -19,123 +152,171 @@ class AdvancedIndicators:
         if df is None or len(df) < 50:
             return df
         
-        df = df.copy()
+        # Ensure column names are lowercase (without touching the caller's frame)
+        df = df.rename(columns=str.lower)
+        
+        close = df['close'].to_numpy(dtype=np.float64)
+        volume = df['volume'].to_numpy(dtype=np.float64)
+        
+        # Every indicator is collected here as a plain array and attached to
+        # the frame in one concat, instead of ~35 separate column insertions
+        out = {}
         
-        # Ensure column names are lowercase
-        df.columns = [col.lower() for col in df.columns]
+        # RSI, ATR, %K and Williams %R share the default 14-bar window; with
+        # numba they come out of a single compiled pass
+        fused = NUMBA_AVAILABLE
+        if fused:
+            high, low, _ = AdvancedIndicators._hlc_arrays(df)
+            rsi, atr, stoch_k, williams_r = _trailing_window_indicators(high, low, close, 14)
         
         # Simple Moving Averages
-        df['sma_10'] = df['close'].rolling(window=10).mean()
-        df['sma_20'] = df['close'].rolling(window=20).mean()
-        df['sma_50'] = df['close'].rolling(window=50).mean()
-        df['sma_200'] = df['close'].rolling(window=200).mean()
+        out['sma_10'] = _rolling_mean(close, 10)
+        out['sma_20'] = _rolling_mean(close, 20)
+        out['sma_50'] = _rolling_mean(close, 50)
+        out['sma_200'] = _rolling_mean(close, 200)
         
         # Exponential Moving Averages
-        df['ema_12'] = df['close'].ewm(span=12, adjust=False).mean()
-        df['ema_26'] = df['close'].ewm(span=26, adjust=False).mean()
-        df['ema_50'] = df['close'].ewm(span=50, adjust=False).mean()
+        out['ema_12'] = df['close'].ewm(span=12, adjust=False).mean().to_numpy()
+        out['ema_26'] = df['close'].ewm(span=26, adjust=False).mean().to_numpy()
+        out['ema_50'] = df['close'].ewm(span=50, adjust=False).mean().to_numpy()
         
         # MACD
-        df['macd'] = df['ema_12'] - df['ema_26']
-        df['macd_signal'] = df['macd'].ewm(span=9, adjust=False).mean()
-        df['macd_histogram'] = df['macd'] - df['macd_signal']
+        out['macd'] = out['ema_12'] - out['ema_26']
+        out['macd_signal'] = pd.Series(out['macd']).ewm(span=9, adjust=False).mean().to_numpy()
+        out['macd_histogram'] = out['macd'] - out['macd_signal']
         
         # RSI
-        df['rsi'] = AdvancedIndicators.calculate_rsi(df['close'])
+        out['rsi'] = rsi if fused else AdvancedIndicators.calculate_rsi(df['close']).to_numpy()
         
         # Bollinger Bands
         bb_window = TradingConfig.BB_WINDOW
         bb_std = TradingConfig.BB_STD_DEV
-        df['bb_middle'] = df['close'].rolling(window=bb_window).mean()
-        bb_std_dev = df['close'].rolling(window=bb_window).std()
-        df['bb_upper'] = df['bb_middle'] + (bb_std_dev * bb_std)
-        df['bb_lower'] = df['bb_middle'] - (bb_std_dev * bb_std)
-        df['bb_width'] = (df['bb_upper'] - df['bb_lower']) / df['bb_middle']
-        df['bb_percent'] = (df['close'] - df['bb_lower']) / (df['bb_upper'] - df['bb_lower'])
+        out['bb_middle'] = _rolling_mean(close, bb_window)
+        bb_std_dev = _rolling_std(close, bb_window)
+        out['bb_upper'] = out['bb_middle'] + (bb_std_dev * bb_std)
+        out['bb_lower'] = out['bb_middle'] - (bb_std_dev * bb_std)
+        
+        with np.errstate(divide='ignore', invalid='ignore'):
+            out['bb_width'] = (out['bb_upper'] - out['bb_lower']) / out['bb_middle']
+            out['bb_percent'] = (close - out['bb_lower']) / (out['bb_upper'] - out['bb_lower'])
         
         # ATR (Average True Range)
-        df['atr'] = AdvancedIndicators.calculate_atr(df)
+        out['atr'] = atr if fused else AdvancedIndicators.calculate_atr(df).to_numpy()
         
         # Stochastic Oscillator
-        stoch = AdvancedIndicators.calculate_stochastic(df)
-        df['stoch_k'] = stoch['k']
-        df['stoch_d'] = stoch['d']
+        if fused:
+            out['stoch_k'] = stoch_k
+            out['stoch_d'] = _rolling_mean(stoch_k, 3)
+        else:
+            stoch = AdvancedIndicators.calculate_stochastic(df)
+            out['stoch_k'] = stoch['k'].to_numpy()
+            out['stoch_d'] = stoch['d'].to_numpy()
         
         # Volume indicators
-        df['volume_sma'] = df['volume'].rolling(window=20).mean()
-        df['volume_ratio'] = df['volume'] / df['volume_sma']
+        out['volume_sma'] = _rolling_mean(volume, 20)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            out['volume_ratio'] = volume / out['volume_sma']
         
         # OBV (On-Balance Volume)
-        df['obv'] = AdvancedIndicators.calculate_obv(df)
+        out['obv'] = AdvancedIndicators.calculate_obv(df).to_numpy()
         
         # VWAP
-        df['vwap'] = AdvancedIndicators.calculate_vwap(df)
+        out['vwap'] = AdvancedIndicators.calculate_vwap(df).to_numpy()
         
         # ADX (Average Directional Index)
-        df['adx'] = AdvancedIndicators.calculate_adx(df)
+        out['adx'] = AdvancedIndicators.calculate_adx(df).to_numpy()
         
         # CCI (Commodity Channel Index)
-        df['cci'] = AdvancedIndicators.calculate_cci(df)
+        out['cci'] = AdvancedIndicators.calculate_cci(df).to_numpy()
         
         # Williams %R
-        df['williams_r'] = AdvancedIndicators.calculate_williams_r(df)
+        out['williams_r'] = (
+            williams_r if fused else AdvancedIndicators.calculate_williams_r(df).to_numpy()
+        )
         
         # Price momentum
-        df['momentum'] = df['close'].pct_change(periods=10) * 100
-        df['roc'] = ((df['close'] / df['close'].shift(10)) - 1) * 100
-        
-        # Support/Resistance levels
-        df['pivot'] = (df['high'].shift(1) + df['low'].shift(1) + df['close'].shift(1)) / 3
-        df['r1'] = 2 * df['pivot'] - df['low'].shift(1)
-        df['s1'] = 2 * df['pivot'] - df['high'].shift(1)
-        df['r2'] = df['pivot'] + (df['high'].shift(1) - df['low'].shift(1))
-        df['s2'] = df['pivot'] - (df['high'].shift(1) - df['low'].shift(1))
+        out['momentum'] = df['close'].pct_change(periods=10).to_numpy() * 100
+        out['roc'] = ((df['close'] / df['close'].shift(10)) - 1).to_numpy() * 100
+        
+        # Support/Resistance levels (from the previous bar)
+        prev_high = df['high'].shift(1).to_numpy(dtype=np.float64)
+        prev_low = df['low'].shift(1).to_numpy(dtype=np.float64)
+        prev_close = df['close'].shift(1).to_numpy(dtype=np.float64)
+        pivot = (prev_high + prev_low + prev_close) / 3
+        prev_range = prev_high - prev_low
+        out['pivot'] = pivot
+        out['r1'] = 2 * pivot - prev_low
+        out['s1'] = 2 * pivot - prev_high
+        out['r2'] = pivot + prev_range
+        out['s2'] = pivot - prev_range
         
         # Trend strength
-        df['trend_strength'] = abs(df['close'] - df['sma_50']) / df['atr']
+        with np.errstate(divide='ignore', invalid='ignore'):
+            out['trend_strength'] = np.abs(close - out['sma_50']) / out['atr']
         
-        return df
+        # Recomputing on an already-enriched frame replaces the old columns
+        df = df.drop(columns=list(out), errors='ignore')
+        return pd.concat([df, pd.DataFrame(out, index=df.index)], axis=1)
+    
+    @staticmethod
+    def _hlc_arrays(df: pd.DataFrame):
+        """High/low/close as float64 arrays, the input format TA-Lib expects."""
+        return (
+            df['high'].to_numpy(dtype=np.float64),
+            df['low'].to_numpy(dtype=np.float64),
+            df['close'].to_numpy(dtype=np.float64)
+        )
+    
+    @staticmethod
+    def _true_range(df: pd.DataFrame) -> np.ndarray:
+        """True range per bar, without materialising a 3-column frame."""
+        high, low, close = AdvancedIndicators._hlc_arrays(df)
+        prev_close = df['close'].shift(1).to_numpy(dtype=np.float64)
+        
+        # fmax skips NaN like DataFrame.max(axis=1), so the first bar is high - low
+        return np.fmax(high - low, np.fmax(np.abs(high - prev_close), np.abs(low - prev_close)))
     
     @staticmethod
     def calculate_rsi(series: pd.Series, window: int = 14) -> pd.Series:
         """Calculate Relative Strength Index."""
         
-        delta = series.diff()
-        gain = (delta.where(delta > 0, 0)).rolling(window=window).mean()
-        loss = (-delta.where(delta < 0, 0)).rolling(window=window).mean()
-        
-        rs = gain / loss
-        rsi = 100 - (100 / (1 + rs))
-        
-        return rsi
+        values = series.to_numpy(dtype=np.float64)
+        delta = np.zeros_like(values)
+        np.subtract(values[1:], values[:-1], out=delta[1:])
+
+        # Split gains and losses into one (n, 2) block so both averages
+        # come out of a single rolling pass; NaN deltas count as zero
+        moves = np.column_stack((
+            np.where(delta > 0, delta, 0.0),
+            np.where(delta < 0, -delta, 0.0)
+        ))
+        averages = _rolling_mean(moves, window)
+
+        with np.errstate(divide='ignore', invalid='ignore'):
+            rs = averages[:, 0] / averages[:, 1]
+            rsi = 100 - (100 / (1 + rs))
+
+        return pd.Series(rsi, index=series.index)
     
     @staticmethod
     def calculate_atr(df: pd.DataFrame, window: int = 14) -> pd.Series:
         """Calculate Average True Range."""
         
-        high = df['high']
-        low = df['low']
-        close = df['close']
-        
-        tr1 = high - low
-        tr2 = abs(high - close.shift(1))
-        tr3 = abs(low - close.shift(1))
+        tr = AdvancedIndicators._true_range(df)
+        atr = _rolling_mean(tr, window)
         
-        tr = pd.concat([tr1, tr2, tr3], axis=1).max(axis=1)
-        atr = tr.rolling(window=window).mean()
-        
-        return atr
+        return pd.Series(atr, index=df.index)
     
     @staticmethod
     def calculate_stochastic(df: pd.DataFrame, k_window: int = 14, 
                             d_window: int = 3) -> dict:
         """Calculate Stochastic Oscillator."""
         
-        low_min = df['low'].rolling(window=k_window).min()
-        high_max = df['high'].rolling(window=k_window).max()
+        low_min = _rolling_min(df['low'].to_numpy(dtype=np.float64), k_window)
+        high_max = _rolling_max(df['high'].to_numpy(dtype=np.float64), k_window)
         
         k = 100 * ((df['close'] - low_min) / (high_max - low_min))
-        d = k.rolling(window=d_window).mean()
+        d = pd.Series(_rolling_mean(k.to_numpy(dtype=np.float64), d_window), index=df.index)
         
         return {'k': k, 'd': d}
     
@@ -143,15 +324,15 @@ class AdvancedIndicators:
     def calculate_obv(df: pd.DataFrame) -> pd.Series:
         """Calculate On-Balance Volume."""
         
-        obv = [0]
-        for i in range(1, len(df)):
-            if df['close'].iloc[i] > df['close'].iloc[i-1]:
-                obv.append(obv[-1] + df['volume'].iloc[i])
-            elif df['close'].iloc[i] < df['close'].iloc[i-1]:
-                obv.append(obv[-1] - df['volume'].iloc[i])
-            else:
-                obv.append(obv[-1])
-        
+        close = df['close'].to_numpy(dtype=np.float64)
+        volume = df['volume'].to_numpy(dtype=np.float64)
+
+        # Signed volume per bar; unchanged or missing closes add nothing, even
+        # when the bar's volume is missing too
+        direction = np.sign(np.diff(close))
+        flow = np.where(direction > 0, volume[1:], np.where(direction < 0, -volume[1:], 0.0))
+        obv = np.concatenate(([0.0], np.cumsum(flow)))
+
         return pd.Series(obv, index=df.index)
     
     @staticmethod
@@ -167,40 +348,51 @@ class AdvancedIndicators:
     def calculate_adx(df: pd.DataFrame, window: int = 14) -> pd.Series:
         """Calculate Average Directional Index."""
         
-        high = df['high']
-        low = df['low']
-        close = df['close']
-        
-        plus_dm = high.diff()
-        minus_dm = low.diff().abs()
+        plus_dm = df['high'].diff()
+        minus_dm = df['low'].diff().abs()
         
         plus_dm[plus_dm < 0] = 0
         minus_dm[minus_dm < 0] = 0
         
-        tr = pd.concat([
-            high - low,
-            (high - close.shift()).abs(),
-            (low - close.shift()).abs()
-        ], axis=1).max(axis=1)
+        tr = AdvancedIndicators._true_range(df)
         
-        atr = tr.rolling(window=window).mean()
-        plus_di = 100 * (plus_dm.rolling(window=window).mean() / atr)
-        minus_di = 100 * (minus_dm.rolling(window=window).mean() / atr)
+        # Smooth TR, +DM and -DM together in one rolling pass
+        smoothed = _rolling_mean(
+            np.column_stack((tr, plus_dm.to_numpy(dtype=np.float64), minus_dm.to_numpy(dtype=np.float64))),
+            window
+        )
         
-        dx = 100 * abs(plus_di - minus_di) / (plus_di + minus_di)
-        adx = dx.rolling(window=window).mean()
+        with np.errstate(divide='ignore', invalid='ignore'):
+            atr = smoothed[:, 0]
+            plus_di = 100 * (smoothed[:, 1] / atr)
+            minus_di = 100 * (smoothed[:, 2] / atr)
+            dx = 100 * np.abs(plus_di - minus_di) / (plus_di + minus_di)
+        adx = _rolling_mean(dx, window)
         
-        return adx
+        return pd.Series(adx, index=df.index)
     
     @staticmethod
     def calculate_cci(df: pd.DataFrame, window: int = 20) -> pd.Series:
         """Calculate Commodity Channel Index."""
         
         typical_price = (df['high'] + df['low'] + df['close']) / 3
-        sma = typical_price.rolling(window=window).mean()
-        mad = typical_price.rolling(window=window).apply(
-            lambda x: np.abs(x - x.mean()).mean(), raw=True
-        )
+        tp = typical_price.to_numpy(dtype=np.float64)
+        
+        # TA-Lib's CCI matches this definition on gap-free data, except that it
+        # reports 0 for a flat window where the ratio is 0/0
+        if TALIB_AVAILABLE and np.isfinite(tp).all():
+            high, low, close = AdvancedIndicators._hlc_arrays(df)
+            cci = talib.CCI(high, low, close, timeperiod=window)
+            cci[_rolling_max(tp, window) == _rolling_min(tp, window)] = np.nan
+            return pd.Series(cci, index=df.index)
+        
+        sma = _rolling_mean(tp, window)
+        if NUMBA_AVAILABLE:
+            mad = pd.Series(_rolling_mad(tp, window), index=df.index)
+        else:
+            mad = typical_price.rolling(window=window).apply(
+                lambda x: np.abs(x - x.mean()).mean(), raw=True
+            )
         
         cci = (typical_price - sma) / (0.015 * mad)
         
@@ -210,8 +402,8 @@ class AdvancedIndicators:
     def calculate_williams_r(df: pd.DataFrame, window: int = 14) -> pd.Series:
         """Calculate Williams %R."""
         
-        highest_high = df['high'].rolling(window=window).max()
-        lowest_low = df['low'].rolling(window=window).min()
+        highest_high = _rolling_max(df['high'].to_numpy(dtype=np.float64), window)
+        lowest_low = _rolling_min(df['low'].to_numpy(dtype=np.float64), window)
         
         williams_r = -100 * (highest_high - df['close']) / (highest_high - lowest_low)
         
@@ -1,12 +1,36 @@
 """Risk Manager for Version 6 Trading App."""
 
 import logging
+import time
 from datetime import datetime, timedelta
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Union
 
-from .config import TradingConfig
+import numpy as np
+
+from .config import NUMBA_AVAILABLE, TradingConfig
 from .data_structures import TradeSignal, Position
 
+if NUMBA_AVAILABLE:
+    from numba import njit
+
+    @njit(cache=True)
+    def _scan_drawdown(equity, peak, max_drawdown):
+        """Running peak and maximum drawdown over an equity curve.
+
+        Follows update_capital step by step, so NaN values neither raise the
+        peak nor count as a drawdown.
+        """
+        for i in range(equity.shape[0]):
+            value = equity[i]
+            if value > peak:
+                peak = value
+            if peak > 0:
+                drawdown = (peak - value) / peak
+                if drawdown > max_drawdown:
+                    max_drawdown = drawdown
+
+        return peak, max_drawdown
+
 
 class RiskManager:
     """Manages trading risk and position sizing."""
@@ -19,16 +43,37 @@ class RiskManager:
         self.daily_trades = 0
         self.max_drawdown_reached = 0.0
         self.peak_value = initial_capital
-        self.trade_history = []
+        self._current_drawdown = 0.0
+        # Risk limits are fixed for the lifetime of the manager
+        self._daily_loss_floor = -initial_capital * TradingConfig.MAX_DAILY_LOSS
+        self._max_drawdown = TradingConfig.MAX_DRAWDOWN
+        self._min_confidence = TradingConfig.MIN_CONFIDENCE
+        self._max_position_fraction = TradingConfig.MAX_POSITION_SIZE
+        # Completed trade P&L and epoch timestamps, grown by doubling
+        self._trade_pnl = np.empty(256)
+        self._trade_time = np.empty(256)
+        self._trade_count = 0
         self.last_reset_date = datetime.now().date()
+        self._next_reset = self._next_midnight()
+    
+    @staticmethod
+    def _next_midnight() -> float:
+        """Epoch timestamp of the next local midnight."""
+        tomorrow = datetime.combine(datetime.now().date() + timedelta(days=1), datetime.min.time())
+        return tomorrow.timestamp()
     
     def reset_daily_stats(self):
         """Reset daily statistics."""
+        # Nothing can have changed before the next local midnight
+        if time.time() < self._next_reset:
+            return
+        
         today = datetime.now().date()
         if today != self.last_reset_date:
             self.daily_pnl = 0.0
             self.daily_trades = 0
             self.last_reset_date = today
+        self._next_reset = self._next_midnight()
     
     def update_capital(self, new_capital: float):
         """Update current capital and track drawdown."""
@@ -43,13 +88,42 @@ class RiskManager:
             drawdown = (self.peak_value - new_capital) / self.peak_value
             if drawdown > self.max_drawdown_reached:
                 self.max_drawdown_reached = drawdown
+            self._current_drawdown = drawdown
+        else:
+            self._current_drawdown = 0.0
+    
+    def update_capital_batch(self, equity: np.ndarray):
+        """Update capital from a sequence of equity values and track drawdown."""
+        equity = np.ascontiguousarray(equity, dtype=np.float64)
+        if equity.size == 0:
+            return
+
+        if NUMBA_AVAILABLE:
+            self.peak_value, self.max_drawdown_reached = _scan_drawdown(
+                equity, float(self.peak_value), float(self.max_drawdown_reached)
+            )
+        else:
+            # Running peak seeded with the current peak; fmax skips missing values
+            peaks = np.fmax.accumulate(np.concatenate(([self.peak_value], equity)))[1:]
+            with np.errstate(divide='ignore', invalid='ignore'):
+                drawdowns = np.where(peaks > 0, (peaks - equity) / peaks, 0.0)
+
+            self.peak_value = float(peaks[-1])
+            self.max_drawdown_reached = float(
+                np.fmax.reduce(drawdowns, initial=self.max_drawdown_reached)
+            )
+
+        self.current_capital = float(equity[-1])
+        self._current_drawdown = 0.0
+        if self.peak_value > 0:
+            self._current_drawdown = (self.peak_value - self.current_capital) / self.peak_value
     
     def calculate_position_size(self, signal: TradeSignal, 
                                current_price: float) -> int:
         """Calculate optimal position size based on risk parameters."""
         
         # Maximum position value based on portfolio percentage
-        max_position_value = self.current_capital * TradingConfig.MAX_POSITION_SIZE
+        max_position_value = self.current_capital * self._max_position_fraction
         
         # Calculate risk per share
         if signal.stop_loss:
@@ -71,9 +145,40 @@ class RiskManager:
         # Minimum 1 share if any signal
         return max(1, adjusted_shares) if adjusted_shares > 0 else 0
     
+    def calculate_position_sizes(self, prices: np.ndarray, stop_losses: np.ndarray,
+                                 confidences: np.ndarray) -> np.ndarray:
+        """Calculate position sizes for many signals at once.
+        
+        Matches calculate_position_size element-wise; a NaN (or zero)
+        stop-loss falls back to the default 2% risk per share.
+        """
+        prices = np.asarray(prices, dtype=np.float64)
+        stop_losses = np.asarray(stop_losses, dtype=np.float64)
+        confidences = np.asarray(confidences, dtype=np.float64)
+        
+        has_stop = ~np.isnan(stop_losses) & (stop_losses != 0)
+        risk_per_share = np.where(has_stop, np.abs(prices - stop_losses), prices * 0.02)
+        
+        with np.errstate(divide='ignore', invalid='ignore'):
+            risk_based_shares = np.where(
+                risk_per_share > 0, np.trunc(self.current_capital * 0.01 / risk_per_share), 0.0
+            )
+            max_shares = np.where(
+                prices > 0, np.trunc(self.current_capital * self._max_position_fraction / prices), 0.0
+            )
+        
+        adjusted_shares = np.trunc(
+            np.minimum(risk_based_shares, max_shares) * np.fmin(1.0, confidences)
+        )
+        return np.maximum(adjusted_shares, 0).astype(np.int64)
+    
     def check_risk_limits(self, signal: TradeSignal, 
-                         current_positions: List[Position]) -> Dict:
-        """Check if trade passes risk limits."""
+                         current_positions: Union[Dict[str, Position], List[Position]]) -> Dict:
+        """Check if trade passes risk limits.
+        
+        Stops at the first failed limit. Positions keyed by symbol make the
+        duplicate-symbol check a lookup; a plain list is scanned.
+        """
         
         self.reset_daily_stats()
         
@@ -83,41 +188,45 @@ class RiskManager:
             'warnings': []
         }
         
-        # Check daily loss limit
-        if self.daily_pnl < -self.initial_capital * TradingConfig.MAX_DAILY_LOSS:
+        # Check minimum confidence
+        if signal.confidence < self._min_confidence:
             result['approved'] = False
             result['reasons'].append(
-                f"Daily loss limit reached ({self.daily_pnl:.2f})"
+                f"Confidence too low ({signal.confidence:.1%} < {self._min_confidence:.1%})"
             )
+            return result
         
         # Check maximum drawdown
-        current_drawdown = (self.peak_value - self.current_capital) / self.peak_value
-        if current_drawdown > TradingConfig.MAX_DRAWDOWN:
+        if self._current_drawdown > self._max_drawdown:
             result['approved'] = False
             result['reasons'].append(
-                f"Maximum drawdown reached ({current_drawdown:.1%})"
+                f"Maximum drawdown reached ({self._current_drawdown:.1%})"
             )
+            return result
         
-        # Check existing positions in same symbol
-        existing_position = next(
-            (p for p in current_positions if p.symbol == signal.symbol), None
-        )
-        if existing_position:
-            result['warnings'].append(
-                f"Already have position in {signal.symbol}"
+        # Check daily loss limit
+        if self.daily_pnl < self._daily_loss_floor:
+            result['approved'] = False
+            result['reasons'].append(
+                f"Daily loss limit reached ({self.daily_pnl:.2f})"
             )
+            return result
         
         # Check total positions
         if len(current_positions) >= 10:
             result['warnings'].append("Maximum positions reached (10)")
             result['approved'] = False
             result['reasons'].append("Too many open positions")
+            return result
         
-        # Check minimum confidence
-        if signal.confidence < TradingConfig.MIN_CONFIDENCE:
-            result['approved'] = False
-            result['reasons'].append(
-                f"Confidence too low ({signal.confidence:.1%} < {TradingConfig.MIN_CONFIDENCE:.1%})"
+        # Check existing positions in same symbol
+        if isinstance(current_positions, dict):
+            has_position = signal.symbol in current_positions
+        else:
+            has_position = any(p.symbol == signal.symbol for p in current_positions)
+        if has_position:
+            result['warnings'].append(
+                f"Already have position in {signal.symbol}"
             )
         
         return result
@@ -127,13 +236,13 @@ class RiskManager:
         """Check if trading should stop due to risk limits."""
         
         # Daily loss limit
-        if daily_loss < -self.initial_capital * TradingConfig.MAX_DAILY_LOSS:
+        if daily_loss < self._daily_loss_floor:
             self.logger.warning("Daily loss limit breached")
             return True
         
         # Maximum drawdown
         drawdown = (self.initial_capital - portfolio_value) / self.initial_capital
-        if drawdown > TradingConfig.MAX_DRAWDOWN:
+        if drawdown > self._max_drawdown:
             self.logger.warning(f"Maximum drawdown breached: {drawdown:.1%}")
             return True
         
@@ -142,29 +251,46 @@ class RiskManager:
     def get_risk_metrics(self) -> Dict:
         """Get current risk metrics."""
         
-        current_drawdown = 0.0
-        if self.peak_value > 0:
-            current_drawdown = (self.peak_value - self.current_capital) / self.peak_value
-        
         return {
             'initial_capital': self.initial_capital,
             'current_capital': self.current_capital,
             'peak_value': self.peak_value,
-            'current_drawdown': current_drawdown,
+            'current_drawdown': self._current_drawdown,
             'max_drawdown_reached': self.max_drawdown_reached,
             'daily_pnl': self.daily_pnl,
             'daily_trades': self.daily_trades,
             'pnl_percent': ((self.current_capital / self.initial_capital) - 1) * 100
         }
     
-    def record_trade(self, pnl: float):
+    def record_trade(self, pnl: float, timestamp: Optional[datetime] = None):
         """Record a completed trade."""
         self.daily_pnl += pnl
         self.daily_trades += 1
-        self.trade_history.append({
-            'pnl': pnl,
-            'timestamp': datetime.now()
-        })
+        
+        n = self._trade_count
+        if n == self._trade_pnl.shape[0]:
+            self._trade_pnl = np.resize(self._trade_pnl, 2 * n)
+            self._trade_time = np.resize(self._trade_time, 2 * n)
+        self._trade_pnl[n] = pnl
+        self._trade_time[n] = timestamp.timestamp() if timestamp else time.time()
+        self._trade_count = n + 1
+    
+    @property
+    def trade_history(self) -> List[Dict]:
+        """Read-only snapshot of completed trades as P&L/timestamp records.
+        
+        Each access builds a new list, so changes to it are not stored; use
+        record_trade and clear_trade_history to modify the history.
+        """
+        n = self._trade_count
+        return [
+            {'pnl': pnl, 'timestamp': datetime.fromtimestamp(ts)}
+            for pnl, ts in zip(self._trade_pnl[:n].tolist(), self._trade_time[:n].tolist())
+        ]
+    
+    def clear_trade_history(self):
+        """Discard all recorded trades."""
+        self._trade_count = 0
     
     def get_risk_summary(self) -> Dict:
         """Alias for get_risk_metrics for compatibility."""
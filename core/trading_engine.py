@@ -172,7 +172,7 @@ class TradingEngine:
 
         # Check risk limits
         risk_check = self.risk_manager.check_risk_limits(
-            signal, list(self.portfolio_manager.positions.values())
+            signal, self.portfolio_manager.positions
         )
 
         if not risk_check['approved']: